@@ -0,0 +1,158 @@
+"""
+Shared Helpers for the Boto3 Scripts
+====================================
+Client configuration, concurrency and output helpers used by
+s3_operations.py, ec2_operations.py and lambda_operations.py.
+
+Author: Your Name
+Course: Cloud Computing
+Date: December 2024
+"""
+
+import functools
+import io
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+# Shared botocore client configuration: TCP keep-alive, a larger connection
+# pool and adaptive retries so repeated calls reuse the same sockets.
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=3,
+    read_timeout=10,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# Worker threads used to overlap independent API calls
+MAX_WORKERS = 8
+
+# Serialises client construction: boto3's default session is not
+# thread-safe, and lru_cache does not stop concurrent first calls
+_CLIENT_LOCK = threading.RLock()
+
+# Guards installation of the sys.stdout proxy
+_STDOUT_LOCK = threading.Lock()
+
+
+def client_factory(func):
+    """
+    Cache a client factory's result per argument tuple.
+    
+    Unlike a bare ``functools.lru_cache``, calls are serialised, so threads
+    that hit a cold cache at the same moment share one client instead of
+    each building their own from boto3's shared default session.
+    """
+    cached = functools.lru_cache(maxsize=None)(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _CLIENT_LOCK:
+            return cached(*args, **kwargs)
+    
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+class ThreadLocalStdout:
+    """
+    ``sys.stdout`` proxy that lets worker threads capture their own output.
+
+    Threads that are not capturing write straight through to the wrapped
+    stream, so the main thread keeps printing normally. Any other attribute
+    (``encoding``, ``isatty()``, ``fileno()``, ...) comes from the wrapped
+    stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def capture(self, func, *args):
+        """Call ``func(*args)`` and return ``(result, captured_output)``."""
+        previous = getattr(self._local, 'buffer', None)
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = previous
+
+
+def _stdout_proxy():
+    """Install the ``ThreadLocalStdout`` proxy once and return it."""
+    with _STDOUT_LOCK:
+        if not isinstance(sys.stdout, ThreadLocalStdout):
+            sys.stdout = ThreadLocalStdout(sys.stdout)
+        return sys.stdout
+
+
+def run_concurrently(calls):
+    """
+    Run independent ``(func, args)`` calls in a thread pool.
+    
+    Each call's printed output is buffered separately so it can be replayed
+    in order once every call has finished, instead of interleaving. The
+    stdout proxy is installed once and left in place, so nested or parallel
+    calls never swap ``sys.stdout`` underneath each other.
+    
+    Args:
+        calls: List of (func, args) tuples
+    
+    Returns:
+        list: (result, output) tuples in the same order as ``calls``
+    """
+    proxy = _stdout_proxy()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(proxy.capture, func, *args) for func, args in calls]
+        return [future.result() for future in futures]
+
+
+def emit(obj):
+    """Write ``obj`` to stdout as a single compact JSON line."""
+    sys.stdout.write(json.dumps(obj, separators=(',', ':')) + "\n")
+
+
+class TTLCache:
+    """Minimal thread-safe key/value cache whose entries expire after a TTL."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for ``key``, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Cache ``value`` under ``key`` for ``ttl`` seconds (default: cache TTL)."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
@@ -13,25 +13,90 @@ Usage:
 """
 
 import boto3
+import functools
 import json
+import os
 import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from botocore.exceptions import ClientError
 from datetime import datetime
+from aws_common import BOTO_CONFIG, TTLCache, client_factory, emit, run_concurrently
 
 # Configuration
 PROJECT_NAME = "job-portal"
 ENVIRONMENT = "dev"
 REGION = "us-east-1"
 
+# Listing helpers print human-readable output by default; VERBOSE=0 switches
+# them to one compact JSON document per call
+VERBOSE = os.getenv('VERBOSE', '1') == '1'
 
+_STATE_EMOJI = {
+    'running': '🟢',
+    'stopped': '🔴',
+    'pending': '🟡',
+    'stopping': '🟠',
+    'terminated': '⚫'
+}
+
+# Maximum page size accepted by describe_instances
+_PAGE_SIZE = 1000
+
+# Instance IDs sent per describe_instances / describe_instance_status call
+_BATCH_SIZE = 100
+
+# Instance metadata cache TTLs (seconds). Identity fields never change for
+# the lifetime of an instance, so they are kept much longer.
+_METADATA_TTL = 900
+_IMMUTABLE_METADATA_TTL = 86400
+_IMMUTABLE_METADATA = frozenset({
+    'instance-id',
+    'ami-id',
+    'mac',
+    'placement/availability-zone',
+    'placement/region'
+})
+
+# IMDS is link-local, so a connection either succeeds almost immediately or
+# not at all. Once a connection fails the "not on EC2" result is kept until
+# clear_metadata_cache() is called.
+_IMDS_TOKEN_TIMEOUT = (0.15, 0.5)
+_IMDS_AVAILABLE = True
+
+
+@client_factory
 def create_ec2_client():
-    """Create and return an EC2 client."""
-    return boto3.client('ec2', region_name=REGION)
+    """Create and return an EC2 client (cached per process)."""
+    return boto3.client('ec2', region_name=REGION, config=BOTO_CONFIG)
 
 
+@client_factory
 def create_ec2_resource():
-    """Create and return an EC2 resource."""
-    return boto3.resource('ec2', region_name=REGION)
+    """Create and return an EC2 resource (cached per process)."""
+    return boto3.resource('ec2', region_name=REGION, config=BOTO_CONFIG)
+
+
+def _tags(instance):
+    """Return an instance's tags as a ``{key: value}`` dict."""
+    return {tag['Key']: tag['Value'] for tag in instance.get('Tags', ())}
+
+
+def _format_instance(instance_info):
+    """Return the printable block for one running instance."""
+    return (
+        f"  Instance: {instance_info['instance_id']}\n"
+        f"    Name: {instance_info['name']}\n"
+        f"    Type: {instance_info['instance_type']}\n"
+        f"    State: {instance_info['state']}\n"
+        f"    Private IP: {instance_info['private_ip']}\n"
+        f"    Public IP: {instance_info['public_ip']}\n"
+        f"    AZ: {instance_info['availability_zone']}\n"
+        f"    VPC: {instance_info['vpc_id']}\n"
+        f"    Launched: {instance_info['launch_time']}\n"
+        f"{'-' * 80}\n"
+    )
 
 
 def list_running_instances():
@@ -45,55 +110,44 @@ def list_running_instances():
     
     try:
         # Filter for running instances
-        response = ec2_client.describe_instances(
+        paginator = ec2_client.get_paginator('describe_instances')
+        pages = paginator.paginate(
             Filters=[
                 {'Name': 'instance-state-name', 'Values': ['running']}
-            ]
+            ],
+            PaginationConfig={'PageSize': _PAGE_SIZE}
         )
         
         instances = []
-        print("\n🖥️  Running EC2 Instances:")
-        print("-" * 80)
-        
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                instance_info = {
-                    'instance_id': instance['InstanceId'],
-                    'instance_type': instance['InstanceType'],
-                    'state': instance['State']['Name'],
-                    'launch_time': instance['LaunchTime'].strftime('%Y-%m-%d %H:%M:%S'),
-                    'private_ip': instance.get('PrivateIpAddress', 'N/A'),
-                    'public_ip': instance.get('PublicIpAddress', 'N/A'),
-                    'availability_zone': instance['Placement']['AvailabilityZone'],
-                    'vpc_id': instance.get('VpcId', 'N/A'),
-                    'subnet_id': instance.get('SubnetId', 'N/A')
-                }
-                
-                # Get instance name from tags
-                instance_name = 'N/A'
-                for tag in instance.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        instance_name = tag['Value']
-                        break
-                instance_info['name'] = instance_name
-                
-                instances.append(instance_info)
-                
-                print(f"  Instance: {instance_info['instance_id']}")
-                print(f"    Name: {instance_info['name']}")
-                print(f"    Type: {instance_info['instance_type']}")
-                print(f"    State: {instance_info['state']}")
-                print(f"    Private IP: {instance_info['private_ip']}")
-                print(f"    Public IP: {instance_info['public_ip']}")
-                print(f"    AZ: {instance_info['availability_zone']}")
-                print(f"    VPC: {instance_info['vpc_id']}")
-                print(f"    Launched: {instance_info['launch_time']}")
-                print("-" * 80)
-        
-        if not instances:
-            print("  No running instances found.")
+        for page in pages:
+            for reservation in page['Reservations']:
+                for instance in reservation['Instances']:
+                    instance_info = {
+                        'instance_id': instance['InstanceId'],
+                        'instance_type': instance['InstanceType'],
+                        'state': instance['State']['Name'],
+                        'launch_time': instance['LaunchTime'].replace(tzinfo=None).isoformat(sep=' ', timespec='seconds'),
+                        'private_ip': instance.get('PrivateIpAddress', 'N/A'),
+                        'public_ip': instance.get('PublicIpAddress', 'N/A'),
+                        'availability_zone': instance['Placement']['AvailabilityZone'],
+                        'vpc_id': instance.get('VpcId', 'N/A'),
+                        'subnet_id': instance.get('SubnetId', 'N/A'),
+                        'name': _tags(instance).get('Name', 'N/A')
+                    }
+                    
+                    instances.append(instance_info)
+        
+        if VERBOSE:
+            print("\n🖥️  Running EC2 Instances:")
+            print("-" * 80)
+            sys.stdout.write("".join(_format_instance(info) for info in instances))
+            
+            if not instances:
+                print("  No running instances found.")
+            else:
+                print(f"\nTotal: {len(instances)} running instance(s)")
         else:
-            print(f"\nTotal: {len(instances)} running instance(s)")
+            emit({'step': 'list_running_instances', 'instances': instances})
         
         return instances
         
@@ -112,44 +166,32 @@ def list_all_instances():
     ec2_client = create_ec2_client()
     
     try:
-        response = ec2_client.describe_instances()
+        paginator = ec2_client.get_paginator('describe_instances')
+        pages = paginator.paginate(PaginationConfig={'PageSize': _PAGE_SIZE})
         
         instances = []
-        print("\n📋 All EC2 Instances:")
-        print("-" * 80)
-        
-        state_emoji = {
-            'running': '🟢',
-            'stopped': '🔴',
-            'pending': '🟡',
-            'stopping': '🟠',
-            'terminated': '⚫'
-        }
-        
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                state = instance['State']['Name']
-                emoji = state_emoji.get(state, '⚪')
-                
-                instance_info = {
-                    'instance_id': instance['InstanceId'],
-                    'instance_type': instance['InstanceType'],
-                    'state': state
-                }
-                
-                # Get instance name
-                instance_name = 'N/A'
-                for tag in instance.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        instance_name = tag['Value']
-                        break
-                instance_info['name'] = instance_name
-                
-                instances.append(instance_info)
-                print(f"  {emoji} {instance_info['instance_id']} - {instance_name} ({state})")
-        
-        if not instances:
-            print("  No instances found.")
+        for page in pages:
+            for reservation in page['Reservations']:
+                for instance in reservation['Instances']:
+                    instances.append({
+                        'instance_id': instance['InstanceId'],
+                        'instance_type': instance['InstanceType'],
+                        'state': instance['State']['Name'],
+                        'name': _tags(instance).get('Name', 'N/A')
+                    })
+        
+        if VERBOSE:
+            print("\n📋 All EC2 Instances:")
+            print("-" * 80)
+            
+            for info in instances:
+                emoji = _STATE_EMOJI.get(info['state'], '⚪')
+                print(f"  {emoji} {info['instance_id']} - {info['name']} ({info['state']})")
+            
+            if not instances:
+                print("  No instances found.")
+        else:
+            emit({'step': 'list_all_instances', 'instances': instances})
         
         return instances
         
@@ -158,6 +200,36 @@ def list_all_instances():
         return []
 
 
+def _instance_details(instance):
+    """Build the details dict for one describe_instances entry."""
+    return {
+        'instance_id': instance['InstanceId'],
+        'instance_type': instance['InstanceType'],
+        'state': instance['State']['Name'],
+        'launch_time': instance['LaunchTime'].isoformat(),
+        'private_ip': instance.get('PrivateIpAddress'),
+        'public_ip': instance.get('PublicIpAddress'),
+        'private_dns': instance.get('PrivateDnsName'),
+        'public_dns': instance.get('PublicDnsName'),
+        'vpc_id': instance.get('VpcId'),
+        'subnet_id': instance.get('SubnetId'),
+        'availability_zone': instance['Placement']['AvailabilityZone'],
+        'security_groups': [sg['GroupName'] for sg in instance.get('SecurityGroups', [])],
+        'ami_id': instance['ImageId'],
+        'key_name': instance.get('KeyName'),
+        'architecture': instance['Architecture'],
+        'root_device_type': instance['RootDeviceType'],
+        'tags': _tags(instance)
+    }
+
+
+def _print_instance_details(details):
+    """Print the details dict of one instance."""
+    print(f"\n🔍 Instance Details: {details['instance_id']}")
+    print("-" * 60)
+    print(json.dumps(details, indent=2))
+
+
 def get_instance_details(instance_id):
     """
     Get detailed information about a specific instance.
@@ -177,31 +249,8 @@ def get_instance_details(instance_id):
             print(f"❌ Instance '{instance_id}' not found.")
             return None
         
-        instance = response['Reservations'][0]['Instances'][0]
-        
-        details = {
-            'instance_id': instance['InstanceId'],
-            'instance_type': instance['InstanceType'],
-            'state': instance['State']['Name'],
-            'launch_time': instance['LaunchTime'].isoformat(),
-            'private_ip': instance.get('PrivateIpAddress'),
-            'public_ip': instance.get('PublicIpAddress'),
-            'private_dns': instance.get('PrivateDnsName'),
-            'public_dns': instance.get('PublicDnsName'),
-            'vpc_id': instance.get('VpcId'),
-            'subnet_id': instance.get('SubnetId'),
-            'availability_zone': instance['Placement']['AvailabilityZone'],
-            'security_groups': [sg['GroupName'] for sg in instance.get('SecurityGroups', [])],
-            'ami_id': instance['ImageId'],
-            'key_name': instance.get('KeyName'),
-            'architecture': instance['Architecture'],
-            'root_device_type': instance['RootDeviceType'],
-            'tags': {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-        }
-        
-        print(f"\n🔍 Instance Details: {instance_id}")
-        print("-" * 60)
-        print(json.dumps(details, indent=2, default=str))
+        details = _instance_details(response['Reservations'][0]['Instances'][0])
+        _print_instance_details(details)
         
         return details
         
@@ -210,81 +259,156 @@ def get_instance_details(instance_id):
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _create_imds_session():
+    """Create and return a pooled HTTP session for the instance metadata service."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+_METADATA_CACHE = TTLCache(_METADATA_TTL)
+
+# Cached in place of endpoints IMDS answers with 404 (e.g. public-ipv4 on an
+# instance without a public IP), so they are not re-fetched on every call
+_ABSENT = object()
+
+
+def clear_metadata_cache():
+    """Forget cached instance metadata so the next lookup probes IMDS again."""
+    global _IMDS_AVAILABLE
+    _METADATA_CACHE.clear()
+    _IMDS_AVAILABLE = True
+
+
+def _mock_metadata():
+    """Print and return placeholder metadata for runs outside of EC2."""
+    print("ℹ️  EC2 metadata service not available.")
+    print("   (This is normal when running outside of EC2)")
+    
+    # Return mock data for demonstration
+    mock_metadata = {
+        'instance-id': 'i-0123456789abcdef0',
+        'instance-type': 't2.micro',
+        'ami-id': 'ami-0123456789abcdef0',
+        'local-ipv4': '10.0.1.100',
+        'availability-zone': 'us-east-1a',
+        'region': 'us-east-1'
+    }
+    
+    print("\n📝 Mock Metadata (for demonstration):")
+    print("-" * 60)
+    for key, value in mock_metadata.items():
+        print(f"  {key}: {value}")
+    
+    return mock_metadata
+
+
 def get_ec2_metadata():
     """
     Retrieve EC2 instance metadata (only works when running on EC2).
     
+    Values, and endpoints that do not exist on this instance, are cached
+    in-process for ``_METADATA_TTL`` seconds (identity fields for longer);
+    call ``clear_metadata_cache()`` to force a refresh.
+    
     Returns:
         dict: Metadata information
     """
+    global _IMDS_AVAILABLE
+    
     metadata_base_url = "http://169.254.169.254/latest/meta-data/"
     token_url = "http://169.254.169.254/latest/api/token"
     
+    # Metadata endpoints to retrieve
+    endpoints = [
+        'instance-id',
+        'instance-type',
+        'ami-id',
+        'hostname',
+        'local-hostname',
+        'local-ipv4',
+        'public-ipv4',
+        'public-hostname',
+        'placement/availability-zone',
+        'placement/region',
+        'security-groups',
+        'mac'
+    ]
+    
+    metadata = {}
+    missing = []
+    for endpoint in endpoints:
+        value = _METADATA_CACHE.get(endpoint)
+        if value is None:
+            missing.append(endpoint)
+        elif value is not _ABSENT:
+            metadata[endpoint] = value
+    
+    if missing and not _IMDS_AVAILABLE:
+        return _mock_metadata()
+    
     try:
-        # Get IMDSv2 token
-        token_response = requests.put(
-            token_url,
-            headers={"X-aws-ec2-metadata-token-ttl-seconds": "21600"},
-            timeout=2
-        )
-        token = token_response.text
-        headers = {"X-aws-ec2-metadata-token": token}
+        if missing:
+            # Get IMDSv2 token
+            session = _create_imds_session()
+            token_response = session.put(
+                token_url,
+                headers={"X-aws-ec2-metadata-token-ttl-seconds": "21600"},
+                timeout=_IMDS_TOKEN_TIMEOUT
+            )
+            token = token_response.text
+            headers = {"X-aws-ec2-metadata-token": token}
+            
+            def fetch(endpoint):
+                try:
+                    response = session.get(
+                        f"{metadata_base_url}{endpoint}",
+                        headers=headers,
+                        timeout=2
+                    )
+                    if response.status_code == 200:
+                        return response.text
+                    if response.status_code == 404:
+                        return _ABSENT
+                except Exception:
+                    pass
+                # Transient failures are retried on the next call
+                return None
+            
+            # The endpoints are independent, so fetch them concurrently over
+            # the shared keep-alive session
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                values = list(executor.map(fetch, missing))
+            
+            for endpoint, value in zip(missing, values):
+                if value is None:
+                    continue
+                if value is _ABSENT or endpoint not in _IMMUTABLE_METADATA:
+                    ttl = None
+                else:
+                    ttl = _IMMUTABLE_METADATA_TTL
+                _METADATA_CACHE.set(endpoint, value, ttl)
+                if value is not _ABSENT:
+                    metadata[endpoint] = value
         
-        # Metadata endpoints to retrieve
-        endpoints = [
-            'instance-id',
-            'instance-type',
-            'ami-id',
-            'hostname',
-            'local-hostname',
-            'local-ipv4',
-            'public-ipv4',
-            'public-hostname',
-            'placement/availability-zone',
-            'placement/region',
-            'security-groups',
-            'mac'
-        ]
-        
-        metadata = {}
         print("\n🏷️  EC2 Instance Metadata:")
         print("-" * 60)
         
         for endpoint in endpoints:
-            try:
-                response = requests.get(
-                    f"{metadata_base_url}{endpoint}",
-                    headers=headers,
-                    timeout=2
-                )
-                if response.status_code == 200:
-                    metadata[endpoint] = response.text
-                    print(f"  {endpoint}: {response.text}")
-            except Exception:
-                pass
+            if endpoint in metadata:
+                print(f"  {endpoint}: {metadata[endpoint]}")
         
         return metadata
         
+    except requests.exceptions.ConnectionError:
+        # Only a failed connection means we are not on EC2; remember that so
+        # later calls skip the probe (ConnectTimeout is a ConnectionError)
+        _IMDS_AVAILABLE = False
+        return _mock_metadata()
     except requests.exceptions.RequestException:
-        print("ℹ️  EC2 metadata service not available.")
-        print("   (This is normal when running outside of EC2)")
-        
-        # Return mock data for demonstration
-        mock_metadata = {
-            'instance-id': 'i-0123456789abcdef0',
-            'instance-type': 't2.micro',
-            'ami-id': 'ami-0123456789abcdef0',
-            'local-ipv4': '10.0.1.100',
-            'availability-zone': 'us-east-1a',
-            'region': 'us-east-1'
-        }
-        
-        print("\n📝 Mock Metadata (for demonstration):")
-        print("-" * 60)
-        for key, value in mock_metadata.items():
-            print(f"  {key}: {value}")
-        
-        return mock_metadata
+        # Transient failures (e.g. a slow token response) are not cached
+        return _mock_metadata()
 
 
 def filter_instances_by_tag(tag_key, tag_value):
@@ -301,25 +425,35 @@ def filter_instances_by_tag(tag_key, tag_value):
     ec2_client = create_ec2_client()
     
     try:
-        response = ec2_client.describe_instances(
+        paginator = ec2_client.get_paginator('describe_instances')
+        pages = paginator.paginate(
             Filters=[
                 {'Name': f'tag:{tag_key}', 'Values': [tag_value]}
-            ]
+            ],
+            PaginationConfig={'PageSize': _PAGE_SIZE}
         )
         
         instances = []
-        print(f"\n🏷️  Instances with tag {tag_key}={tag_value}:")
-        print("-" * 60)
-        
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                instance_id = instance['InstanceId']
-                state = instance['State']['Name']
-                instances.append({'id': instance_id, 'state': state})
-                print(f"  • {instance_id} ({state})")
-        
-        if not instances:
-            print("  No matching instances found.")
+        for page in pages:
+            for reservation in page['Reservations']:
+                for instance in reservation['Instances']:
+                    instances.append({'id': instance['InstanceId'], 'state': instance['State']['Name']})
+        
+        if VERBOSE:
+            print(f"\n🏷️  Instances with tag {tag_key}={tag_value}:")
+            print("-" * 60)
+            
+            for info in instances:
+                print(f"  • {info['id']} ({info['state']})")
+            
+            if not instances:
+                print("  No matching instances found.")
+        else:
+            emit({
+                'step': 'filter_instances_by_tag',
+                'tag': {tag_key: tag_value},
+                'instances': instances
+            })
         
         return instances
         
@@ -328,6 +462,32 @@ def filter_instances_by_tag(tag_key, tag_value):
         return []
 
 
+def _status_info(status):
+    """Flatten a describe_instance_status entry into a status dict."""
+    return {
+        'instance_id': status['InstanceId'],
+        'instance_state': status['InstanceState']['Name'],
+        'system_status': status['SystemStatus']['Status'],
+        'instance_status': status['InstanceStatus']['Status'],
+        'availability_zone': status['AvailabilityZone']
+    }
+
+
+def _print_instance_status(instance_id, status_info):
+    """Print the status checks of one instance (or why there are none)."""
+    if status_info is None:
+        print(f"ℹ️  No status available for '{instance_id}'")
+        print("   (Instance may be stopped or status not yet available)")
+        return
+    
+    print(f"\n✅ Instance Status: {instance_id}")
+    print("-" * 60)
+    print(f"  State: {status_info['instance_state']}")
+    print(f"  System Status: {status_info['system_status']}")
+    print(f"  Instance Status: {status_info['instance_status']}")
+    print(f"  AZ: {status_info['availability_zone']}")
+
+
 def get_instance_status(instance_id):
     """
     Get the status checks for an instance.
@@ -345,27 +505,9 @@ def get_instance_status(instance_id):
             InstanceIds=[instance_id]
         )
         
-        if not response['InstanceStatuses']:
-            print(f"ℹ️  No status available for '{instance_id}'")
-            print("   (Instance may be stopped or status not yet available)")
-            return None
-        
-        status = response['InstanceStatuses'][0]
-        
-        status_info = {
-            'instance_id': status['InstanceId'],
-            'instance_state': status['InstanceState']['Name'],
-            'system_status': status['SystemStatus']['Status'],
-            'instance_status': status['InstanceStatus']['Status'],
-            'availability_zone': status['AvailabilityZone']
-        }
-        
-        print(f"\n✅ Instance Status: {instance_id}")
-        print("-" * 60)
-        print(f"  State: {status_info['instance_state']}")
-        print(f"  System Status: {status_info['system_status']}")
-        print(f"  Instance Status: {status_info['instance_status']}")
-        print(f"  AZ: {status_info['availability_zone']}")
+        statuses = response['InstanceStatuses']
+        status_info = _status_info(statuses[0]) if statuses else None
+        _print_instance_status(instance_id, status_info)
         
         return status_info
         
@@ -374,6 +516,64 @@ def get_instance_status(instance_id):
         return None
 
 
+def _batches(items, size):
+    """Yield successive ``size``-long slices of ``items``."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def get_bulk_instance_details(instance_ids):
+    """
+    Describe many instances with as few API calls as possible.
+    
+    Args:
+        instance_ids: List of EC2 instance IDs
+    
+    Returns:
+        dict: Instance details keyed by instance ID
+    """
+    ec2_client = create_ec2_client()
+    instances = {}
+    
+    try:
+        for batch in _batches(list(instance_ids), _BATCH_SIZE):
+            response = ec2_client.describe_instances(InstanceIds=batch)
+            for reservation in response['Reservations']:
+                for instance in reservation['Instances']:
+                    instances[instance['InstanceId']] = _instance_details(instance)
+        return instances
+        
+    except ClientError as e:
+        print(f"❌ Error getting instance details: {e}")
+        return instances
+
+
+def get_bulk_instance_status(instance_ids):
+    """
+    Get status checks for many instances with as few API calls as possible.
+    
+    Args:
+        instance_ids: List of EC2 instance IDs
+    
+    Returns:
+        dict: Status information keyed by instance ID (instances without
+        an available status are omitted)
+    """
+    ec2_client = create_ec2_client()
+    statuses = {}
+    
+    try:
+        for batch in _batches(list(instance_ids), _BATCH_SIZE):
+            response = ec2_client.describe_instance_status(InstanceIds=batch)
+            for status in response['InstanceStatuses']:
+                statuses[status['InstanceId']] = _status_info(status)
+        return statuses
+        
+    except ClientError as e:
+        print(f"❌ Error getting status: {e}")
+        return statuses
+
+
 def main():
     """Main function to demonstrate EC2 operations."""
     print("=" * 60)
@@ -384,38 +584,42 @@ def main():
     print(f"   Region: {REGION}")
     print(f"   Project: {PROJECT_NAME}")
     
-    # 1. List all instances
-    print("\n" + "=" * 60)
-    print("STEP 1: List All EC2 Instances")
-    print("=" * 60)
-    all_instances = list_all_instances()
-    
-    # 2. List running instances
-    print("\n" + "=" * 60)
-    print("STEP 2: List Running EC2 Instances")
-    print("=" * 60)
-    running_instances = list_running_instances()
+    # Steps 1-4 are independent, so run them concurrently and print
+    # their output in order afterwards
+    steps = [
+        ("STEP 1: List All EC2 Instances", list_all_instances, ()),
+        ("STEP 2: List Running EC2 Instances", list_running_instances, ()),
+        ("STEP 3: Retrieve EC2 Metadata", get_ec2_metadata, ()),
+        ("STEP 4: Filter Instances by Project Tag", filter_instances_by_tag, ('Project', PROJECT_NAME)),
+    ]
+    results = run_concurrently([(func, args) for _, func, args in steps])
     
-    # 3. Get EC2 metadata (if running on EC2)
-    print("\n" + "=" * 60)
-    print("STEP 3: Retrieve EC2 Metadata")
-    print("=" * 60)
-    metadata = get_ec2_metadata()
+    for (title, _, _), (_, output) in zip(steps, results):
+        print("\n" + "=" * 60)
+        print(title)
+        print("=" * 60)
+        sys.stdout.write(output)
     
-    # 4. Filter instances by project tag
-    print("\n" + "=" * 60)
-    print("STEP 4: Filter Instances by Project Tag")
-    print("=" * 60)
-    filter_instances_by_tag('Project', PROJECT_NAME)
+    running_instances = results[1][0]
     
-    # 5. Get details of first running instance (if any)
+    # 5. Get details and status checks of every running instance
     if running_instances:
         print("\n" + "=" * 60)
         print("STEP 5: Get Detailed Instance Information")
         print("=" * 60)
-        first_instance_id = running_instances[0]['instance_id']
-        get_instance_details(first_instance_id)
-        get_instance_status(first_instance_id)
+        instance_ids = [info['instance_id'] for info in running_instances]
+        # Details and status checks are separate APIs; fetch them together,
+        # batching the instance IDs into as few calls as possible
+        (details, details_output), (statuses, status_output) = run_concurrently([
+            (get_bulk_instance_details, (instance_ids,)),
+            (get_bulk_instance_status, (instance_ids,)),
+        ])
+        sys.stdout.write(details_output + status_output)
+        
+        for instance_id in instance_ids:
+            if instance_id in details:
+                _print_instance_details(details[instance_id])
+            _print_instance_status(instance_id, statuses.get(instance_id))
     
     print("\n" + "=" * 60)
     print("EC2 Operations Demo Complete!")
@@ -15,8 +15,13 @@ Usage:
 import boto3
 import json
 import base64
-from botocore.exceptions import ClientError
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from datetime import datetime
+from aws_common import BOTO_CONFIG, MAX_WORKERS, client_factory, emit, run_concurrently
 
 # Configuration
 PROJECT_NAME = "job-portal"
@@ -24,36 +29,94 @@ ENVIRONMENT = "dev"
 REGION = "us-east-1"
 LAMBDA_FUNCTION_NAME = f"{PROJECT_NAME}-{ENVIRONMENT}-s3-upload-logger"
 
+# Listing helpers print human-readable output by default; VERBOSE=0 switches
+# them to one compact JSON document per call
+VERBOSE = os.getenv('VERBOSE', '1') == '1'
 
-def create_lambda_client():
-    """Create and return a Lambda client."""
-    return boto3.client('lambda', region_name=REGION)
+# ListFunctions returns at most 50 functions per page; MaxItems caps the
+# total number of functions fetched across all pages
+_LIST_FUNCTIONS_PAGE_SIZE = 50
+_LIST_FUNCTIONS_MAX_ITEMS = 10000
 
+# Payloads at least this long (characters) are printed compactly instead of
+# being encoded a second time with indentation
+_PRETTY_PAYLOAD_LIMIT = 4096
 
+# Synchronous invocations may run for up to the 900 s Lambda limit, and a
+# timed-out Invoke must not be re-sent (the first call may still be
+# running), so invocations get a long read timeout and a single attempt.
+_INVOKE_CONFIG = BOTO_CONFIG.merge(Config(
+    read_timeout=900,
+    retries={'total_max_attempts': 1, 'mode': 'standard'}
+))
+
+
+@client_factory
+def _lambda_client(region):
+    """Create and return a Lambda client for ``region`` (cached per region)."""
+    # A dedicated session, since list_lambda_functions_by_region builds
+    # clients for other regions from worker threads
+    session = boto3.session.Session()
+    return session.client('lambda', region_name=region, config=BOTO_CONFIG)
+
+
+def create_lambda_client(region=None):
+    """Create and return a Lambda client (cached per process and region)."""
+    # Resolve the default first so create_lambda_client() and
+    # create_lambda_client(REGION) share one cache entry
+    return _lambda_client(region or REGION)
+
+
+@client_factory
+def create_lambda_invoke_client():
+    """Create and return the Lambda client used for Invoke (cached per process)."""
+    return boto3.client('lambda', region_name=REGION, config=_INVOKE_CONFIG)
+
+
+@client_factory
 def create_logs_client():
-    """Create and return a CloudWatch Logs client."""
-    return boto3.client('logs', region_name=REGION)
+    """Create and return a CloudWatch Logs client (cached per process)."""
+    return boto3.client('logs', region_name=REGION, config=BOTO_CONFIG)
+
+
+def _format_function(func_info):
+    """Return the printable block for one Lambda function."""
+    return (
+        f"  Function: {func_info['name']}\n"
+        f"    Runtime: {func_info['runtime']}\n"
+        f"    Memory: {func_info['memory']} MB\n"
+        f"    Timeout: {func_info['timeout']} seconds\n"
+        f"    Description: {func_info['description'][:50]}...\n"
+        f"    Last Modified: {func_info['last_modified']}\n"
+        f"{'-' * 80}\n"
+    )
 
 
-def list_lambda_functions():
+def list_lambda_functions(verbose=VERBOSE, names_only=False):
     """
     List all Lambda functions in the account.
     
+    Args:
+        verbose: Print the listing as text rather than a JSON line
+            (defaults to the VERBOSE setting)
+        names_only: Return only function names instead of detail dicts
+    
     Returns:
-        list: List of Lambda function details
+        list: List of Lambda function details (or names)
     """
     lambda_client = create_lambda_client()
     
     try:
         paginator = lambda_client.get_paginator('list_functions')
+        pages = paginator.paginate(
+            PaginationConfig={'PageSize': _LIST_FUNCTIONS_PAGE_SIZE, 'MaxItems': _LIST_FUNCTIONS_MAX_ITEMS}
+        )
         
-        functions = []
-        print("\n⚡ Lambda Functions:")
-        print("-" * 80)
-        
-        for page in paginator.paginate():
-            for func in page['Functions']:
-                func_info = {
+        if names_only:
+            functions = [func['FunctionName'] for page in pages for func in page['Functions']]
+        else:
+            functions = [
+                {
                     'name': func['FunctionName'],
                     'runtime': func.get('Runtime', 'N/A'),
                     'memory': func['MemorySize'],
@@ -61,20 +124,25 @@ def list_lambda_functions():
                     'last_modified': func['LastModified'],
                     'description': func.get('Description', 'No description')
                 }
-                functions.append(func_info)
-                
-                print(f"  Function: {func_info['name']}")
-                print(f"    Runtime: {func_info['runtime']}")
-                print(f"    Memory: {func_info['memory']} MB")
-                print(f"    Timeout: {func_info['timeout']} seconds")
-                print(f"    Description: {func_info['description'][:50]}...")
-                print(f"    Last Modified: {func_info['last_modified']}")
-                print("-" * 80)
-        
-        if not functions:
-            print("  No Lambda functions found.")
+                for page in pages for func in page['Functions']
+            ]
+        
+        if verbose:
+            print("\n⚡ Lambda Functions:")
+            print("-" * 80)
+            
+            for func_info in functions:
+                if names_only:
+                    print(f"  Function: {func_info}")
+                else:
+                    sys.stdout.write(_format_function(func_info))
+            
+            if not functions:
+                print("  No Lambda functions found.")
+            else:
+                print(f"\nTotal: {len(functions)} function(s)")
         else:
-            print(f"\nTotal: {len(functions)} function(s)")
+            emit({'step': 'list_lambda_functions', 'functions': functions})
         
         return functions
         
@@ -83,6 +151,57 @@ def list_lambda_functions():
         return []
 
 
+def list_lambda_functions_by_region(regions, verbose=VERBOSE):
+    """
+    List Lambda function names in several regions concurrently.
+    
+    Args:
+        regions: List of AWS region names
+        verbose: Print the listing as text rather than a JSON line
+            (defaults to the VERBOSE setting)
+    
+    Returns:
+        dict: Function names keyed by region
+    """
+    def list_region(region):
+        paginator = create_lambda_client(region).get_paginator('list_functions')
+        pages = paginator.paginate(
+            PaginationConfig={'PageSize': _LIST_FUNCTIONS_PAGE_SIZE, 'MaxItems': _LIST_FUNCTIONS_MAX_ITEMS}
+        )
+        return [func['FunctionName'] for page in pages for func in page['Functions']]
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {region: executor.submit(list_region, region) for region in regions}
+    
+    functions = {}
+    errors = {}
+    for region, future in futures.items():
+        try:
+            functions[region] = future.result()
+        except (ClientError, BotoCoreError) as e:
+            # BotoCoreError covers unknown regions and unreachable endpoints
+            functions[region] = []
+            errors[region] = str(e)
+    
+    if verbose:
+        print("\n🌍 Lambda Functions by Region:")
+        print("-" * 60)
+        
+        for region in functions:
+            if region in errors:
+                print(f"  ❌ {region}: {errors[region]}")
+            else:
+                print(f"  {region}: {len(functions[region])} function(s)")
+    else:
+        emit({
+            'step': 'list_lambda_functions_by_region',
+            'functions': functions,
+            'errors': errors
+        })
+    
+    return functions
+
+
 def get_function_details(function_name):
     """
     Get detailed information about a Lambda function.
@@ -149,7 +268,7 @@ def invoke_lambda(function_name, payload=None, invocation_type='RequestResponse'
     Returns:
         dict: Invocation response
     """
-    lambda_client = create_lambda_client()
+    lambda_client = create_lambda_invoke_client()
     
     if payload is None:
         # Default test payload simulating S3 upload event
@@ -180,13 +299,21 @@ def invoke_lambda(function_name, payload=None, invocation_type='RequestResponse'
     try:
         print(f"\n🚀 Invoking Lambda Function: {function_name}")
         print("-" * 60)
+        # Serialize once for the wire; only small payloads are re-encoded
+        # with indentation for display
+        wire_payload = json.dumps(payload, separators=(',', ':'))
+        if len(wire_payload) < _PRETTY_PAYLOAD_LIMIT:
+            display_payload = json.dumps(payload, indent=2)
+        else:
+            display_payload = wire_payload
+        
         print(f"  Invocation Type: {invocation_type}")
-        print(f"  Payload: {json.dumps(payload, indent=2)}")
+        print(f"  Payload: {display_payload}")
         
         response = lambda_client.invoke(
             FunctionName=function_name,
             InvocationType=invocation_type,
-            Payload=json.dumps(payload)
+            Payload=wire_payload.encode('utf-8')
         )
         
         status_code = response['StatusCode']
@@ -197,10 +324,12 @@ def invoke_lambda(function_name, payload=None, invocation_type='RequestResponse'
             'function_error': response.get('FunctionError')
         }
         
-        # Read response payload
+        # Read response payload (json.loads accepts the raw bytes directly;
+        # async 'Event' invocations return an empty body)
         if 'Payload' in response:
-            payload_response = json.loads(response['Payload'].read())
-            result['response'] = payload_response
+            raw_payload = response['Payload'].read()
+            if raw_payload:
+                result['response'] = json.loads(raw_payload)
         
         print(f"\n✅ Lambda Invocation Result:")
         print("-" * 60)
@@ -221,6 +350,10 @@ def invoke_lambda(function_name, payload=None, invocation_type='RequestResponse'
         else:
             print(f"❌ Error invoking function: {e}")
         return None
+    except BotoCoreError as e:
+        # Read timeouts and connection failures are not ClientErrors
+        print(f"❌ Error invoking function: {e}")
+        return None
 
 
 def get_function_logs(function_name, limit=10):
@@ -266,12 +399,15 @@ def get_function_logs(function_name, limit=10):
         print(f"   Log Stream: {log_stream_name}")
         print("-" * 80)
         
-        for event in events:
-            timestamp = datetime.fromtimestamp(event['timestamp'] / 1000)
-            message = event['message'].strip()
-            print(f"  [{timestamp}] {message}")
-        
-        if not events:
+        if events:
+            # Format every line first and emit them with a single write
+            lines = [
+                f"  [{datetime.fromtimestamp(event['timestamp'] / 1000)}] {event['message'].strip()}"
+                for event in events
+            ]
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+        else:
             print("  No log events found.")
         
         return events
@@ -354,25 +490,25 @@ def main():
     print(f"   Region: {REGION}")
     print(f"   Target Function: {LAMBDA_FUNCTION_NAME}")
     
-    # 1. List all Lambda functions
-    print("\n" + "=" * 60)
-    print("STEP 1: List All Lambda Functions")
-    print("=" * 60)
-    list_lambda_functions()
-    
-    # 2. Get function details
-    print("\n" + "=" * 60)
-    print("STEP 2: Get Function Details")
-    print("=" * 60)
-    details = get_function_details(LAMBDA_FUNCTION_NAME)
+    # Steps 1-3 only read state, so fetch them concurrently and print their
+    # output in order afterwards
+    steps = [
+        ("STEP 1: List All Lambda Functions", list_lambda_functions, ()),
+        ("STEP 2: Get Function Details", get_function_details, (LAMBDA_FUNCTION_NAME,)),
+        ("STEP 3: Get Function Configuration", get_function_configuration, (LAMBDA_FUNCTION_NAME,)),
+    ]
+    results = run_concurrently([(func, args) for _, func, args in steps])
+    details = results[1][0]
     
-    if details:
-        # 3. Get function configuration
+    # Configuration is only meaningful when the function exists
+    shown = steps if details else steps[:2]
+    for (title, _, _), (_, output) in zip(shown, results):
         print("\n" + "=" * 60)
-        print("STEP 3: Get Function Configuration")
+        print(title)
         print("=" * 60)
-        get_function_configuration(LAMBDA_FUNCTION_NAME)
-        
+        sys.stdout.write(output)
+    
+    if details:
         # 4. Invoke Lambda function manually
         print("\n" + "=" * 60)
         print("STEP 4: Invoke Lambda Function (Synchronous)")
@@ -13,41 +13,186 @@ Usage:
 """
 
 import boto3
+import io
+import itertools
 import json
 import os
+import secrets
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from aws_common import BOTO_CONFIG, MAX_WORKERS, client_factory, emit, run_concurrently
 
 # Configuration
 PROJECT_NAME = "job-portal"
 ENVIRONMENT = "dev"
 REGION = "us-east-1"
 
+# Object metadata attached to every upload
+_BASE_METADATA = {
+    'uploaded-by': 'boto3-script',
+    'project': PROJECT_NAME
+}
 
+# Tags applied to buckets created by this script
+_BUCKET_TAGS = {
+    'Project': PROJECT_NAME,
+    'Environment': ENVIRONMENT,
+    'ManagedBy': 'boto3'
+}
+
+# Listing helpers print human-readable output by default; VERBOSE=0 switches
+# them to one compact JSON document per call
+VERBOSE = os.getenv('VERBOSE', '1') == '1'
+
+# Maximum keys returned per list_objects_v2 page
+_LIST_PAGE_SIZE = 1000
+
+# Maximum rows printed by the listing helpers
+_DISPLAY_LIMIT = 50
+
+# Maximum keys accepted per delete_objects request
+_DELETE_BATCH_SIZE = 1000
+
+# Threads each managed transfer uses for multipart parts
+_TRANSFER_CONCURRENCY = 16
+
+# Size of each multipart part (bytes)
+_MULTIPART_CHUNKSIZE = 50 * 1024 ** 2
+
+# Managed transfer settings: files larger than one part are uploaded as
+# 50 MB parts on up to _TRANSFER_CONCURRENCY threads. Smaller files go up in
+# a single PutObject, since splitting them would yield one part anyway.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNKSIZE,
+    multipart_chunksize=_MULTIPART_CHUNKSIZE,
+    max_concurrency=_TRANSFER_CONCURRENCY,
+    use_threads=True
+)
+
+# The shared client configuration with a connection pool large enough for
+# every concurrent upload thread, so connections are never discarded and
+# re-established under load, and botocore's default 60 s read timeout for
+# large transfers and batch deletes.
+_BOTO_CONFIG = BOTO_CONFIG.merge(Config(
+    max_pool_connections=MAX_WORKERS * _TRANSFER_CONCURRENCY,
+    read_timeout=60
+))
+
+
+@client_factory
 def create_s3_client():
-    """Create and return an S3 client."""
-    return boto3.client('s3', region_name=REGION)
+    """Create and return an S3 client (cached per process)."""
+    return boto3.client('s3', region_name=REGION, config=_BOTO_CONFIG)
 
 
+@client_factory
 def create_s3_resource():
-    """Create and return an S3 resource."""
-    return boto3.resource('s3', region_name=REGION)
+    """Create and return an S3 resource (cached per process)."""
+    return boto3.resource('s3', region_name=REGION, config=_BOTO_CONFIG)
+
+
+def _format_time(timestamp):
+    """Format an S3 timestamp as 'YYYY-MM-DD HH:MM:SS' without strftime."""
+    return timestamp.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
 
 
-def create_bucket(bucket_name):
+def _sync_bucket_settings(s3_client, bucket_name):
+    """
+    Enable versioning and apply the project tags on an existing bucket.
+    
+    Each setting is read first and only written when it differs, so re-runs
+    against an already configured bucket make no write calls. Tags that are
+    already on the bucket are kept.
+    
+    Args:
+        s3_client: S3 client to use
+        bucket_name: Name of the bucket
+    """
+    versioning = s3_client.get_bucket_versioning(Bucket=bucket_name)
+    if versioning.get('Status') != 'Enabled':
+        s3_client.put_bucket_versioning(
+            Bucket=bucket_name,
+            VersioningConfiguration={'Status': 'Enabled'}
+        )
+        print(f"✅ Versioning enabled for bucket '{bucket_name}'")
+    
+    try:
+        tag_set = s3_client.get_bucket_tagging(Bucket=bucket_name).get('TagSet', [])
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'NoSuchTagSet':
+            raise
+        tag_set = []
+    
+    current_tags = {tag['Key']: tag['Value'] for tag in tag_set}
+    desired_tags = {**current_tags, **_BUCKET_TAGS}
+    if desired_tags != current_tags:
+        s3_client.put_bucket_tagging(
+            Bucket=bucket_name,
+            Tagging={
+                'TagSet': [{'Key': key, 'Value': value} for key, value in desired_tags.items()]
+            }
+        )
+        print(f"✅ Tags added to bucket '{bucket_name}'")
+
+
+def _bucket_exists(s3_client, bucket_name):
+    """
+    Check whether a bucket exists and is accessible to the caller.
+    
+    Args:
+        s3_client: S3 client to use
+        bucket_name: Name of the bucket
+    
+    Returns:
+        bool: True if the bucket exists, False if it does not (404). Other
+        errors, such as 403 for a bucket owned by another account, are
+        re-raised.
+    """
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchBucket'):
+            return False
+        raise
+
+
+def _reuse_bucket(s3_client, bucket_name):
+    """Report an already owned bucket and bring its settings up to date."""
+    print(f"ℹ️  Bucket '{bucket_name}' already exists and is owned by you.")
+    try:
+        _sync_bucket_settings(s3_client, bucket_name)
+    except ClientError as e:
+        print(f"⚠️  Could not update bucket settings: {e}")
+
+
+def create_bucket(bucket_name, s3_client=None):
     """
     Create an S3 bucket.
     
+    An existing bucket owned by the caller is reused. Its versioning and
+    tags are only written when they differ from the desired settings.
+    
     Args:
         bucket_name: Name of the bucket to create
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
-        bool: True if bucket was created successfully
+        bool: True if the bucket was created or already owned by you
     """
-    s3_client = create_s3_client()
+    s3_client = s3_client or create_s3_client()
     
     try:
+        # us-east-1 answers CreateBucket on an owned bucket with a 200, so
+        # check first instead of relying on BucketAlreadyOwnedByYou
+        if _bucket_exists(s3_client, bucket_name):
+            _reuse_bucket(s3_client, bucket_name)
+            return True
+        
         # For us-east-1, don't specify LocationConstraint
         if REGION == 'us-east-1':
             s3_client.create_bucket(Bucket=bucket_name)
@@ -59,22 +204,17 @@ def create_bucket(bucket_name):
         
         print(f"✅ Bucket '{bucket_name}' created successfully!")
         
-        # Enable versioning
+        # A new bucket has no versioning or tags yet, so write them directly
         s3_client.put_bucket_versioning(
             Bucket=bucket_name,
             VersioningConfiguration={'Status': 'Enabled'}
         )
         print(f"✅ Versioning enabled for bucket '{bucket_name}'")
         
-        # Add tags
         s3_client.put_bucket_tagging(
             Bucket=bucket_name,
             Tagging={
-                'TagSet': [
-                    {'Key': 'Project', 'Value': PROJECT_NAME},
-                    {'Key': 'Environment', 'Value': ENVIRONMENT},
-                    {'Key': 'ManagedBy', 'Value': 'boto3'}
-                ]
+                'TagSet': [{'Key': key, 'Value': value} for key, value in _BUCKET_TAGS.items()]
             }
         )
         print(f"✅ Tags added to bucket '{bucket_name}'")
@@ -84,9 +224,10 @@ def create_bucket(bucket_name):
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'BucketAlreadyOwnedByYou':
-            print(f"ℹ️  Bucket '{bucket_name}' already exists and is owned by you.")
+            # Created by another caller between the check and the create
+            _reuse_bucket(s3_client, bucket_name)
             return True
-        elif error_code == 'BucketAlreadyExists':
+        elif error_code in ('BucketAlreadyExists', '403'):
             print(f"❌ Bucket name '{bucket_name}' is already taken globally.")
             return False
         else:
@@ -94,7 +235,7 @@ def create_bucket(bucket_name):
             return False
 
 
-def upload_file(bucket_name, file_path, object_key=None):
+def upload_file(bucket_name, file_path, object_key=None, upload_time=None, s3_client=None):
     """
     Upload a file to an S3 bucket.
     
@@ -102,39 +243,75 @@ def upload_file(bucket_name, file_path, object_key=None):
         bucket_name: Target bucket name
         file_path: Local path to the file
         object_key: S3 object key (optional, defaults to filename)
+        upload_time: ISO timestamp for the upload-time metadata (optional,
+            defaults to now; batch callers pass one shared value)
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
         bool: True if file was uploaded successfully
     """
-    s3_client = create_s3_client()
+    s3_client = s3_client or create_s3_client()
     
     # Use filename as key if not specified
     if object_key is None:
         object_key = os.path.basename(file_path)
     
+    if upload_time is None:
+        upload_time = datetime.now(timezone.utc).isoformat()
+    
     try:
         # Upload with metadata
-        extra_args = {
-            'Metadata': {
-                'uploaded-by': 'boto3-script',
-                'project': PROJECT_NAME,
-                'upload-time': datetime.now().isoformat()
-            }
-        }
+        extra_args = {'Metadata': {**_BASE_METADATA, 'upload-time': upload_time}}
         
-        s3_client.upload_file(file_path, bucket_name, object_key, ExtraArgs=extra_args)
+        s3_client.upload_file(
+            file_path,
+            bucket_name,
+            object_key,
+            ExtraArgs=extra_args,
+            Config=_TRANSFER_CONFIG
+        )
         print(f"✅ File '{file_path}' uploaded to 's3://{bucket_name}/{object_key}'")
         return True
         
     except FileNotFoundError:
         print(f"❌ File '{file_path}' not found.")
         return False
-    except ClientError as e:
+    except (ClientError, S3UploadFailedError) as e:
+        # The managed transfer wraps failed PutObject/multipart calls in
+        # S3UploadFailedError rather than raising the ClientError
         print(f"❌ Error uploading file: {e}")
         return False
 
 
-def upload_string_as_file(bucket_name, content, object_key):
+def upload_files(bucket_name, file_paths, prefix='', s3_client=None):
+    """
+    Upload several files to an S3 bucket concurrently.
+    
+    Args:
+        bucket_name: Target bucket name
+        file_paths: Local paths of the files to upload
+        prefix: Key prefix prepended to each filename (optional)
+        s3_client: S3 client to use (optional, defaults to the shared client)
+    
+    Returns:
+        list: Upload result (bool) for each file, in order
+    """
+    # One timestamp for the whole batch
+    upload_time = datetime.now(timezone.utc).isoformat()
+    
+    results = run_concurrently([
+        (upload_file, (bucket_name, path, f"{prefix}{os.path.basename(path)}", upload_time, s3_client))
+        for path in file_paths
+    ])
+    
+    uploaded = []
+    for result, output in results:
+        sys.stdout.write(output)
+        uploaded.append(result)
+    return uploaded
+
+
+def upload_string_as_file(bucket_name, content, object_key, s3_client=None):
     """
     Upload a string as a file to S3.
     
@@ -142,22 +319,27 @@ def upload_string_as_file(bucket_name, content, object_key):
         bucket_name: Target bucket name
         content: String content to upload
         object_key: S3 object key
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
         bool: True if successful
     """
-    s3_client = create_s3_client()
+    s3_client = s3_client or create_s3_client()
     
     try:
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=object_key,
-            Body=content.encode('utf-8'),
-            ContentType='text/plain',
-            Metadata={
-                'uploaded-by': 'boto3-script',
-                'project': PROJECT_NAME
-            }
+        # upload_fileobj goes through the transfer manager, so large content
+        # is sent as parallel multipart parts instead of one PUT
+        s3_client.upload_fileobj(
+            io.BytesIO(content.encode('utf-8')),
+            bucket_name,
+            object_key,
+            ExtraArgs={
+                'ContentType': 'text/plain',
+                'Metadata': _BASE_METADATA,
+                # CRC32 comes from zlib and avoids hashing the body with MD5
+                'ChecksumAlgorithm': 'CRC32'
+            },
+            Config=_TRANSFER_CONFIG
         )
         print(f"✅ Content uploaded to 's3://{bucket_name}/{object_key}'")
         return True
@@ -167,14 +349,34 @@ def upload_string_as_file(bucket_name, content, object_key):
         return False
 
 
-def list_buckets():
-    """List all S3 buckets in the account."""
-    s3_client = create_s3_client()
+def list_buckets(verbose=VERBOSE, s3_client=None):
+    """
+    List all S3 buckets in the account.
+    
+    Args:
+        verbose: Print the listing as text rather than a JSON line
+            (defaults to the VERBOSE setting)
+        s3_client: S3 client to use (optional, defaults to the shared client)
+    
+    Returns:
+        list: Buckets as returned by list_buckets
+    """
+    s3_client = s3_client or create_s3_client()
     
     try:
         response = s3_client.list_buckets()
         buckets = response.get('Buckets', [])
         
+        if not verbose:
+            emit({
+                'step': 'list_buckets',
+                'buckets': [
+                    {'name': bucket['Name'], 'created': _format_time(bucket['CreationDate'])}
+                    for bucket in buckets
+                ]
+            })
+            return buckets
+        
         print("\n📦 S3 Buckets in Account:")
         print("-" * 50)
         
@@ -182,10 +384,13 @@ def list_buckets():
             print("No buckets found.")
             return []
         
-        for bucket in buckets:
+        # Only the displayed rows are formatted
+        for bucket in itertools.islice(buckets, _DISPLAY_LIMIT):
             name = bucket['Name']
-            created = bucket['CreationDate'].strftime('%Y-%m-%d %H:%M:%S')
+            created = _format_time(bucket['CreationDate'])
             print(f"  • {name} (Created: {created})")
+        if len(buckets) > _DISPLAY_LIMIT:
+            print(f"  ... and {len(buckets) - _DISPLAY_LIMIT} more")
         
         print(f"\nTotal: {len(buckets)} bucket(s)")
         return buckets
@@ -195,38 +400,80 @@ def list_buckets():
         return []
 
 
-def list_objects(bucket_name, prefix=''):
+def iter_objects(bucket_name, prefix='', s3_client=None):
+    """
+    Iterate over the objects in an S3 bucket page by page.
+    
+    Unlike list_objects, nothing is printed or accumulated, so callers that
+    only count or filter keys use constant memory. Errors are raised as
+    ClientError while iterating.
+    
+    Args:
+        bucket_name: Name of the bucket
+        prefix: Filter objects by prefix (optional)
+        s3_client: S3 client to use (optional, defaults to the shared client)
+    
+    Yields:
+        dict: Object summaries as returned by list_objects_v2
+    """
+    s3_client = s3_client or create_s3_client()
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        PaginationConfig={'PageSize': _LIST_PAGE_SIZE}
+    )
+    for page in pages:
+        yield from page.get('Contents', [])
+
+
+def list_objects(bucket_name, prefix='', verbose=VERBOSE, s3_client=None):
     """
     List objects in an S3 bucket.
     
     Args:
         bucket_name: Name of the bucket
         prefix: Filter objects by prefix (optional)
+        verbose: Print the listing as text rather than a JSON line
+            (defaults to the VERBOSE setting)
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
         list: List of objects in the bucket
     """
-    s3_client = create_s3_client()
-    
     try:
-        paginator = s3_client.get_paginator('list_objects_v2')
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        objects = list(iter_objects(bucket_name, prefix, s3_client))
         
-        objects = []
-        print(f"\n📄 Objects in 's3://{bucket_name}/{prefix}':")
-        print("-" * 60)
-        
-        for page in pages:
-            for obj in page.get('Contents', []):
-                objects.append(obj)
+        if verbose:
+            print(f"\n📄 Objects in 's3://{bucket_name}/{prefix}':")
+            print("-" * 60)
+            
+            # Only the displayed rows are formatted
+            for obj in itertools.islice(objects, _DISPLAY_LIMIT):
                 size_kb = obj['Size'] / 1024
-                modified = obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S')
+                modified = _format_time(obj['LastModified'])
                 print(f"  • {obj['Key']} ({size_kb:.2f} KB, Modified: {modified})")
-        
-        if not objects:
-            print("  No objects found.")
+            if len(objects) > _DISPLAY_LIMIT:
+                print(f"  ... and {len(objects) - _DISPLAY_LIMIT} more")
+            
+            if not objects:
+                print("  No objects found.")
+            else:
+                print(f"\nTotal: {len(objects)} object(s)")
         else:
-            print(f"\nTotal: {len(objects)} object(s)")
+            emit({
+                'step': 'list_objects',
+                'bucket': bucket_name,
+                'prefix': prefix,
+                'objects': [
+                    {
+                        'key': obj['Key'],
+                        'size': obj['Size'],
+                        'last_modified': _format_time(obj['LastModified'])
+                    }
+                    for obj in objects
+                ]
+            })
         
         return objects
         
@@ -235,17 +482,18 @@ def list_objects(bucket_name, prefix=''):
         return []
 
 
-def get_bucket_info(bucket_name):
+def get_bucket_info(bucket_name, s3_client=None):
     """
     Get detailed information about a bucket.
     
     Args:
         bucket_name: Name of the bucket
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
         dict: Bucket information
     """
-    s3_client = create_s3_client()
+    s3_client = s3_client or create_s3_client()
     
     info = {'name': bucket_name}
     
@@ -278,18 +526,19 @@ def get_bucket_info(bucket_name):
         return info
 
 
-def delete_object(bucket_name, object_key):
+def delete_object(bucket_name, object_key, s3_client=None):
     """
     Delete an object from S3.
     
     Args:
         bucket_name: Name of the bucket
         object_key: Key of the object to delete
+        s3_client: S3 client to use (optional, defaults to the shared client)
     
     Returns:
         bool: True if successful
     """
-    s3_client = create_s3_client()
+    s3_client = s3_client or create_s3_client()
     
     try:
         s3_client.delete_object(Bucket=bucket_name, Key=object_key)
@@ -300,15 +549,50 @@ def delete_object(bucket_name, object_key):
         return False
 
 
+def delete_objects_batch(bucket_name, object_keys, s3_client=None):
+    """
+    Delete many objects from S3 using batched delete_objects requests.
+    
+    Args:
+        bucket_name: Name of the bucket
+        object_keys: Keys of the objects to delete
+        s3_client: S3 client to use (optional, defaults to the shared client)
+    
+    Returns:
+        bool: True if every object was deleted
+    """
+    s3_client = s3_client or create_s3_client()
+    object_keys = list(object_keys)
+    failed = 0
+    
+    try:
+        # delete_objects accepts up to 1000 keys per request
+        for start in range(0, len(object_keys), _DELETE_BATCH_SIZE):
+            batch = object_keys[start:start + _DELETE_BATCH_SIZE]
+            response = s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            )
+            for error in response.get('Errors', []):
+                failed += 1
+                print(f"❌ Error deleting 's3://{bucket_name}/{error['Key']}': {error['Message']}")
+        
+        print(f"✅ Deleted {len(object_keys) - failed} object(s) from 's3://{bucket_name}'")
+        return failed == 0
+        
+    except ClientError as e:
+        print(f"❌ Error deleting objects: {e}")
+        return False
+
+
 def main():
     """Main function to demonstrate S3 operations."""
     print("=" * 60)
     print("AWS S3 Operations Demo - Job Portal Project")
     print("=" * 60)
     
-    # Generate unique bucket name
-    import random
-    suffix = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=8))
+    # Generate unique bucket name (8 lowercase hex characters)
+    suffix = secrets.token_hex(4)
     bucket_name = f"{PROJECT_NAME}-{ENVIRONMENT}-files-{suffix}"
     
     print(f"\n🚀 Starting S3 operations demo...")
@@ -346,24 +630,35 @@ def main():
         - BS Computer Science, University XYZ
         """
         
-        # Upload as resume
-        upload_string_as_file(bucket_name, sample_resume, "resumes/john_doe_resume.txt")
-        
-        # Upload company logo placeholder
+        # Company logo placeholder
         logo_content = "This is a placeholder for company logo"
-        upload_string_as_file(bucket_name, logo_content, "logos/company_logo.txt")
         
-        # 4. List uploaded objects
-        print("\n" + "=" * 60)
-        print("STEP 4: List Uploaded Objects")
-        print("=" * 60)
-        list_objects(bucket_name)
+        sample_files = {
+            "resumes/john_doe_resume.txt": sample_resume,
+            "logos/company_logo.txt": logo_content
+        }
         
-        # 5. Get bucket info
-        print("\n" + "=" * 60)
-        print("STEP 5: Get Bucket Information")
-        print("=" * 60)
-        get_bucket_info(bucket_name)
+        # Uploads are independent, so send them concurrently over the
+        # shared client
+        for _, output in run_concurrently([
+            (upload_string_as_file, (bucket_name, content, object_key))
+            for object_key, content in sample_files.items()
+        ]):
+            sys.stdout.write(output)
+        
+        # Steps 4-5 only read the bucket, so run them concurrently and
+        # print their output in order afterwards
+        steps = [
+            ("STEP 4: List Uploaded Objects", list_objects, (bucket_name,)),
+            ("STEP 5: Get Bucket Information", get_bucket_info, (bucket_name,)),
+        ]
+        results = run_concurrently([(func, args) for _, func, args in steps])
+        
+        for (title, _, _), (_, output) in zip(steps, results):
+            print("\n" + "=" * 60)
+            print(title)
+            print("=" * 60)
+            sys.stdout.write(output)
     
     print("\n" + "=" * 60)
     print("S3 Operations Demo Complete!")
@@ -12,12 +12,32 @@ Date: December 2024
 import json
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Environment configuration, read once per cold start
+PROJECT_NAME = os.environ.get('PROJECT_NAME', 'job-portal')
+ENVIRONMENT = os.environ.get('ENVIRONMENT', 'dev')
+
+# Units used by format_size, one per power of 1024
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+# File categories by extension
+_CATEGORIES = {
+    'resume': ['pdf', 'doc', 'docx', 'txt', 'rtf', 'odt'],
+    'image': ['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp', 'ico'],
+    'data': ['csv', 'xlsx', 'xls', 'json', 'xml', 'yaml', 'yml'],
+    'archive': ['zip', 'tar', 'gz', 'rar', '7z'],
+    'video': ['mp4', 'avi', 'mov', 'mkv', 'webm'],
+    'audio': ['mp3', 'wav', 'flac', 'aac', 'ogg']
+}
+
+# Reverse lookup built once at cold start: extension -> category
+EXT_TO_CATEGORY = {ext: category for category, exts in _CATEGORIES.items() for ext in exts}
+
 
 def lambda_handler(event, context):
     """
@@ -30,11 +50,10 @@ def lambda_handler(event, context):
     Returns:
         dict: Response with status code and message
     """
-    project_name = os.environ.get('PROJECT_NAME', 'job-portal')
-    environment = os.environ.get('ENVIRONMENT', 'dev')
-    
-    logger.info(f"[{project_name}] S3 Upload Event Received")
-    logger.info(f"Full Event: {json.dumps(event, indent=2)}")
+    logger.info("[%s] S3 Upload Event Received", PROJECT_NAME)
+    # The full event is only serialized when DEBUG logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full Event: %s", json.dumps(event))
     
     processed_records = []
     
@@ -46,40 +65,34 @@ def lambda_handler(event, context):
             bucket_name = s3_info.get('bucket', {}).get('name', 'Unknown')
             object_key = s3_info.get('object', {}).get('key', 'Unknown')
             object_size = s3_info.get('object', {}).get('size', 0)
-            event_time = record.get('eventTime', datetime.now().isoformat())
+            # Only build a fallback timestamp when the record has none
+            event_time = record.get('eventTime') or datetime.now(timezone.utc).isoformat()
             event_name = record.get('eventName', 'Unknown')
             
+            # Categorize file type
+            _, dot, extension = object_key.rpartition('.')
+            file_extension = extension.lower() if dot else 'unknown'
+            file_category = categorize_file(file_extension)
+            
             # Create structured log entry
             log_entry = {
                 'timestamp': event_time,
-                'project': project_name,
-                'environment': environment,
+                'project': PROJECT_NAME,
+                'environment': ENVIRONMENT,
                 'event_type': event_name,
                 'bucket': bucket_name,
                 'object_key': object_key,
                 'object_size_bytes': object_size,
                 'object_size_readable': format_size(object_size),
                 'source_ip': record.get('requestParameters', {}).get('sourceIPAddress', 'Unknown'),
-                'user_identity': record.get('userIdentity', {}).get('principalId', 'Unknown')
+                'user_identity': record.get('userIdentity', {}).get('principalId', 'Unknown'),
+                'file_category': file_category,
+                'file_extension': file_extension
             }
             
-            # Log the structured information
-            logger.info("=" * 60)
-            logger.info("S3 UPLOAD EVENT DETAILS")
-            logger.info("=" * 60)
-            logger.info(f"Timestamp: {log_entry['timestamp']}")
-            logger.info(f"Bucket: {log_entry['bucket']}")
-            logger.info(f"Object Key: {log_entry['object_key']}")
-            logger.info(f"Size: {log_entry['object_size_readable']} ({log_entry['object_size_bytes']} bytes)")
-            logger.info(f"Event Type: {log_entry['event_type']}")
-            logger.info(f"Source IP: {log_entry['source_ip']}")
-            
-            # Categorize file type
-            file_extension = object_key.split('.')[-1].lower() if '.' in object_key else 'unknown'
-            file_category = categorize_file(file_extension)
-            logger.info(f"File Category: {file_category}")
-            logger.info(f"File Extension: {file_extension}")
-            logger.info("=" * 60)
+            # Log the structured information as a single JSON line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s", json.dumps(log_entry, separators=(',', ':')))
             
             processed_records.append({
                 'bucket': bucket_name,
@@ -88,8 +101,8 @@ def lambda_handler(event, context):
             })
             
         except Exception as e:
-            logger.error(f"Error processing record: {str(e)}")
-            logger.error(f"Record: {json.dumps(record, indent=2)}")
+            logger.error("Error processing record: %s", e)
+            logger.error("Record: %s", json.dumps(record, indent=2))
     
     response = {
         'statusCode': 200,
@@ -100,7 +113,8 @@ def lambda_handler(event, context):
         })
     }
     
-    logger.info(f"Lambda Response: {json.dumps(response, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Lambda Response: %s", json.dumps(response))
     return response
 
 
@@ -116,14 +130,13 @@ def format_size(size_bytes):
     """
     if size_bytes == 0:
         return "0 B"
+    if size_bytes < 1024:
+        # Fractional and negative sizes have no valid bit length
+        return f"{size_bytes:.2f} B"
     
-    size_names = ("B", "KB", "MB", "GB", "TB")
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024
-        i += 1
-    
-    return f"{size_bytes:.2f} {size_names[i]}"
+    # floor(log1024(size)) from the integer bit length, capped at TB
+    i = min(int(size_bytes).bit_length() - 1, 49) // 10
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_NAMES[i]}"
 
 
 def categorize_file(extension):
@@ -136,20 +149,7 @@ def categorize_file(extension):
     Returns:
         str: Category name
     """
-    categories = {
-        'resume': ['pdf', 'doc', 'docx', 'txt', 'rtf', 'odt'],
-        'image': ['jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'bmp', 'ico'],
-        'data': ['csv', 'xlsx', 'xls', 'json', 'xml', 'yaml', 'yml'],
-        'archive': ['zip', 'tar', 'gz', 'rar', '7z'],
-        'video': ['mp4', 'avi', 'mov', 'mkv', 'webm'],
-        'audio': ['mp3', 'wav', 'flac', 'aac', 'ogg']
-    }
-    
-    for category, extensions in categories.items():
-        if extension.lower() in extensions:
-            return category
-    
-    return 'other'
+    return EXT_TO_CATEGORY.get(extension.lower(), 'other')
 
 
 # For local testing